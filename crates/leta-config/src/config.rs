@@ -13,6 +13,14 @@ struct ConfigLock {
 
 impl ConfigLock {
     fn acquire_exclusive() -> Result<Self, std::io::Error> {
+        Self::acquire(libc::LOCK_EX)
+    }
+
+    fn acquire_shared() -> Result<Self, std::io::Error> {
+        Self::acquire(libc::LOCK_SH)
+    }
+
+    fn acquire(operation: libc::c_int) -> Result<Self, std::io::Error> {
         let lock_path = get_config_path().with_extension("lock");
         if let Some(parent) = lock_path.parent() {
             std::fs::create_dir_all(parent)?;
@@ -23,7 +31,7 @@ impl ConfigLock {
             .truncate(true)
             .open(&lock_path)?;
         let fd = file.as_raw_fd();
-        let result = unsafe { libc::flock(fd, libc::LOCK_EX) };
+        let result = unsafe { libc::flock(fd, operation) };
         if result != 0 {
             return Err(std::io::Error::last_os_error());
         }
@@ -120,7 +128,9 @@ pub struct Config {
 
 impl Config {
     pub fn load() -> Result<Self, ConfigError> {
-        let _lock = ConfigLock::acquire_exclusive()?;
+        // Readers only need to exclude writers, so concurrent CLI invocations
+        // don't queue up behind each other just to read the config.
+        let _lock = ConfigLock::acquire_shared()?;
         Self::load_unlocked()
     }
 
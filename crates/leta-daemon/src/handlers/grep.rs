@@ -4,11 +4,12 @@ use std::path::{Path, PathBuf};
 use fastrace::future::FutureExt as _;
 use fastrace::trace;
 use fastrace::Span;
-use leta_fs::{get_language_id, read_file_content};
+use leta_fs::get_language_id;
 use leta_lsp::lsp_types::{DocumentSymbolParams, TextDocumentIdentifier};
 use leta_servers::get_server_for_language;
 use leta_types::{GrepParams, GrepResult, StreamDone, StreamMessage, SymbolInfo};
 use rayon::prelude::*;
+use regex::bytes::Regex as BytesRegex;
 use regex::Regex;
 use tokio::sync::mpsc;
 use tracing::{debug, warn};
@@ -18,6 +19,7 @@ use crate::session::WorkspaceHandle;
 
 struct GrepFilter<'a> {
     regex: &'a Regex,
+    match_all_names: bool,
     kinds: Option<&'a HashSet<String>>,
     exclude_regexes: &'a [Regex],
     path_regex: Option<&'a Regex>,
@@ -25,7 +27,7 @@ struct GrepFilter<'a> {
 
 impl GrepFilter<'_> {
     fn matches(&self, sym: &SymbolInfo) -> bool {
-        if !self.regex.is_match(&sym.name) {
+        if !self.match_all_names && !self.regex.is_match(&sym.name) {
             return false;
         }
         if let Some(kinds) = self.kinds {
@@ -68,6 +70,11 @@ pub const SKIP_DIRS: &[&str] = &[
     "target",
 ];
 
+// `.*` and the empty pattern accept every name, so skip the regex for them.
+fn matches_all_names(pattern: &str) -> bool {
+    matches!(pattern, "" | ".*" | "^.*" | ".*$")
+}
+
 fn should_use_prefilter(pattern: &str) -> bool {
     if pattern.is_empty() {
         return false;
@@ -85,7 +92,7 @@ fn should_use_prefilter(pattern: &str) -> bool {
     true
 }
 
-fn pattern_to_text_regex(pattern: &str) -> Option<Regex> {
+fn pattern_to_text_regex(pattern: &str) -> Option<BytesRegex> {
     let core = pattern
         .trim_start_matches("(?i)")
         .trim_start_matches('^')
@@ -97,7 +104,7 @@ fn pattern_to_text_regex(pattern: &str) -> Option<Regex> {
         ""
     };
 
-    Regex::new(&format!("{}{}", flags, core)).ok()
+    BytesRegex::new(&format!("{}{}", flags, core)).ok()
 }
 
 #[trace]
@@ -150,6 +157,7 @@ pub async fn handle_grep(ctx: &HandlerContext, params: GrepParams) -> Result<Gre
 
     let filter = GrepFilter {
         regex: &regex,
+        match_all_names: matches_all_names(&params.pattern),
         kinds: kinds_set.as_ref(),
         exclude_regexes: &exclude_regexes,
         path_regex: path_regex.as_ref(),
@@ -273,7 +281,7 @@ fn classify_and_filter_cached(
     ctx: &HandlerContext,
     workspace_root: &Path,
     files: &[PathBuf],
-    text_regex: Option<&Regex>,
+    text_regex: Option<&BytesRegex>,
     filter: &GrepFilter<'_>,
     limit: usize,
 ) -> (Vec<SymbolInfo>, HashMap<String, Vec<PathBuf>>, bool) {
@@ -411,7 +419,7 @@ fn filter_cached_symbols<'a>(
 #[trace]
 fn prefilter_uncached_files<'a>(
     uncached_files: &[&'a PathBuf],
-    text_regex: Option<&Regex>,
+    text_regex: Option<&BytesRegex>,
 ) -> Vec<&'a PathBuf> {
     let start = std::time::Instant::now();
     let result = match text_regex {
@@ -543,9 +551,27 @@ async fn collect_and_filter_symbols(
     Ok(results)
 }
 
-fn prefilter_file(file_path: &Path, text_regex: &Regex) -> bool {
-    match read_file_content(file_path) {
-        Ok(content) => text_regex.is_match(&content),
+fn prefilter_file(file_path: &Path, text_regex: &BytesRegex) -> bool {
+    // Match on the raw bytes so files that can't contain the pattern are
+    // rejected without being decoded. Files that do match still have to be
+    // valid UTF-8, since they are opened as documents afterwards.
+    match std::fs::read(file_path) {
+        Ok(bytes) => {
+            if !text_regex.is_match(&bytes) {
+                return false;
+            }
+            match std::str::from_utf8(&bytes) {
+                Ok(_) => true,
+                Err(e) => {
+                    warn!(
+                        "Failed to read file for prefilter {}: {}",
+                        file_path.display(),
+                        e
+                    );
+                    false
+                }
+            }
+        }
         Err(e) => {
             warn!(
                 "Failed to read file for prefilter {}: {}",
@@ -562,7 +588,7 @@ fn classify_all_files(
     ctx: &HandlerContext,
     workspace_root: &Path,
     files: &[PathBuf],
-    text_regex: Option<&Regex>,
+    text_regex: Option<&BytesRegex>,
     excluded_languages: &HashSet<String>,
 ) -> (Vec<SymbolInfo>, HashMap<String, Vec<PathBuf>>) {
     use rayon::prelude::*;
@@ -761,13 +787,7 @@ pub fn get_cached_symbols(
 ) -> Option<Vec<SymbolInfo>> {
     use std::sync::atomic::Ordering;
 
-    let file_mtime = leta_fs::file_mtime(file_path);
-    let cache_key = format!(
-        "{}:{}:{}",
-        file_path.display(),
-        workspace_root.display(),
-        file_mtime
-    );
+    let cache_key = build_cache_key(workspace_root, file_path);
 
     if let Some(cached) = ctx.symbol_cache.get::<Vec<SymbolInfo>>(&cache_key) {
         ctx.cache_stats.symbol_hits.fetch_add(1, Ordering::Relaxed);
@@ -798,13 +818,7 @@ pub async fn get_file_symbols_no_wait(
     use std::sync::atomic::Ordering;
 
     let start = std::time::Instant::now();
-    let file_mtime = leta_fs::file_mtime(file_path);
-    let cache_key = format!(
-        "{}:{}:{}",
-        file_path.display(),
-        workspace_root.display(),
-        file_mtime
-    );
+    let cache_key = build_cache_key(workspace_root, file_path);
     let cache_key_time = start.elapsed();
 
     if let Some(cached) = ctx.symbol_cache.get::<Vec<SymbolInfo>>(&cache_key) {
@@ -1030,6 +1044,7 @@ async fn handle_grep_streaming_inner(
 
     let filter = GrepFilter {
         regex: &regex,
+        match_all_names: matches_all_names(&params.pattern),
         kinds: kinds_set.as_ref(),
         exclude_regexes: &exclude_regexes,
         path_regex: path_regex.as_ref(),
@@ -1237,3 +1252,23 @@ async fn stream_and_filter_symbols(
         errors: workspace_errors.into_values().collect(),
     })
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_matches_all_names_wildcards() {
+        for pattern in ["", ".*", "^.*", ".*$"] {
+            assert!(matches_all_names(pattern), "{:?}", pattern);
+        }
+    }
+
+    #[test]
+    fn test_matches_all_names_anchors_only() {
+        // `^.*$` can't span a newline, and some servers return names with one
+        for pattern in ["^$", "^", "$", "^^$$", "^.*$", ".", "foo.*"] {
+            assert!(!matches_all_names(pattern), "{:?}", pattern);
+        }
+    }
+}
@@ -68,9 +68,8 @@ pub async fn handle_add_workspace(
         .map_err(|e| format!("Invalid path: {}", e))?;
     let workspace_str = workspace_root.to_string_lossy().to_string();
 
-    let config = Config::load().map_err(|e| e.to_string())?;
-
-    if config.workspaces.roots.contains(&workspace_str) {
+    let added = Config::add_workspace_root(&workspace_root).map_err(|e| e.to_string())?;
+    if !added {
         return Ok(AddWorkspaceResult {
             added: false,
             workspace_root: workspace_str,
@@ -78,8 +77,6 @@ pub async fn handle_add_workspace(
         });
     }
 
-    Config::add_workspace_root(&workspace_root).map_err(|e| e.to_string())?;
-
     info!("Added workspace: {}", workspace_root.display());
 
     let ctx_clone = HandlerContext::new(
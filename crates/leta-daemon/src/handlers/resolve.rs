@@ -201,9 +201,10 @@ fn filter_symbols(
     let target_name = parts.last().unwrap_or(&"");
 
     let mut filtered: Vec<&SymbolInfo> = if let Some(pf) = path_filter {
+        let path_re = Regex::new(pf).ok();
         all_symbols
             .iter()
-            .filter(|s| matches_path(&s.path, pf))
+            .filter(|s| matches_path(&s.path, pf, path_re.as_ref()))
             .collect()
     } else {
         all_symbols.iter().collect()
@@ -330,8 +331,8 @@ fn parse_symbol_path(symbol_path: &str) -> Result<(Option<String>, Option<u32>,
     }
 }
 
-fn matches_path(rel_path: &str, filter: &str) -> bool {
-    if let Ok(re) = Regex::new(filter) {
+fn matches_path(rel_path: &str, filter: &str, filter_re: Option<&Regex>) -> bool {
+    if let Some(re) = filter_re {
         re.is_match(rel_path)
     } else {
         rel_path.contains(filter)
@@ -6,6 +6,7 @@ use fastrace::prelude::*;
 use leta_cache::LmdbCache;
 use leta_config::{get_pid_path, get_socket_path, remove_pid, write_pid, Config};
 use leta_types::*;
+use serde::Deserialize;
 use serde_json::{json, Value};
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
 use tokio::net::{UnixListener, UnixStream};
@@ -22,6 +23,22 @@ use crate::handlers::{
 use crate::profiling::CollectingReporter;
 use crate::session::Session;
 
+#[derive(Deserialize)]
+struct DaemonRequest {
+    #[serde(default)]
+    method: String,
+    #[serde(default = "empty_params")]
+    params: Value,
+    #[serde(default)]
+    profile: bool,
+    #[serde(default)]
+    stream: bool,
+}
+
+fn empty_params() -> Value {
+    json!({})
+}
+
 pub struct DaemonServer {
     session: Arc<Session>,
     hover_cache: Arc<LmdbCache>,
@@ -97,14 +114,20 @@ impl DaemonServer {
     async fn handle_client(&self, mut stream: UnixStream) -> anyhow::Result<()> {
         let mut data = Vec::new();
         let mut buf = [0u8; 4096];
+        let mut line_end = None;
 
         loop {
             let n = stream.read(&mut buf).await?;
             if n == 0 {
                 break;
             }
+            // Only the newly read chunk can contain the terminator, so don't
+            // rescan everything accumulated so far on each read.
+            if let Some(pos) = buf[..n].iter().position(|&b| b == b'\n') {
+                line_end = Some(data.len() + pos);
+            }
             data.extend_from_slice(&buf[..n]);
-            if data.contains(&b'\n') {
+            if line_end.is_some() {
                 break;
             }
         }
@@ -113,19 +136,14 @@ impl DaemonServer {
             return Ok(());
         }
 
-        let line_end = data.iter().position(|&b| b == b'\n').unwrap_or(data.len());
-        let request: Value = serde_json::from_slice(&data[..line_end])?;
-
-        let method = request.get("method").and_then(|m| m.as_str()).unwrap_or("");
-        let params = request.get("params").cloned().unwrap_or(json!({}));
-        let profile = request
-            .get("profile")
-            .and_then(|p| p.as_bool())
-            .unwrap_or(false);
-        let stream_mode = request
-            .get("stream")
-            .and_then(|s| s.as_bool())
-            .unwrap_or(false);
+        let line_end = line_end.unwrap_or(data.len());
+        let DaemonRequest {
+            method,
+            params,
+            profile,
+            stream: stream_mode,
+        } = serde_json::from_slice(&data[..line_end])?;
+        let method = method.as_str();
 
         let ctx = HandlerContext::new(
             Arc::clone(&self.session),
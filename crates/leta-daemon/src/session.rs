@@ -1,6 +1,8 @@
 use std::collections::HashMap;
+use std::os::unix::fs::MetadataExt;
 use std::path::{Path, PathBuf};
 use std::sync::Arc;
+use std::time::{Duration, SystemTime, UNIX_EPOCH};
 
 use fastrace::trace;
 use leta_config::Config;
@@ -16,9 +18,59 @@ pub struct OpenDocument {
     _uri: String,
     _version: i32,
     pub content: String,
+    stamp: Option<FileStamp>,
     _language_id: String,
 }
 
+/// Files changed this recently may change again within the same timestamp
+/// tick (1s on HFS+ and some NFS, 2s on FAT), so their stamp isn't trusted yet.
+const RACY_STAMP_WINDOW: Duration = Duration::from_secs(2);
+
+/// Identity and change times of a file, used to skip re-reading documents
+/// that are already open with the same content.
+///
+/// mtime alone isn't enough: `mv`, `cp -p`, `rsync -t`, `tar x` and `touch -r`
+/// all restore an old mtime. Replacing the file changes dev/ino, and any
+/// write or metadata change bumps ctime, which user tools can't set back.
+#[derive(Clone, Copy, PartialEq, Eq)]
+struct FileStamp {
+    dev: u64,
+    ino: u64,
+    len: u64,
+    mtime: SystemTime,
+    ctime: SystemTime,
+}
+
+impl FileStamp {
+    /// Returns `None` when the file can't be stat'ed or changed too recently
+    /// for its timestamps to reliably reflect later edits; callers then fall
+    /// back to comparing content.
+    fn trusted(path: &Path) -> Option<Self> {
+        Self::trusted_at(path, SystemTime::now())
+    }
+
+    fn trusted_at(path: &Path, now: SystemTime) -> Option<Self> {
+        let meta = std::fs::metadata(path).ok()?;
+        let mtime = meta.modified().ok()?;
+        let ctime = UNIX_EPOCH
+            + Duration::new(
+                u64::try_from(meta.ctime()).ok()?,
+                u32::try_from(meta.ctime_nsec()).ok()?,
+            );
+        let age = now.duration_since(mtime.max(ctime)).ok()?;
+        if age < RACY_STAMP_WINDOW {
+            return None;
+        }
+        Some(Self {
+            dev: meta.dev(),
+            ino: meta.ino(),
+            len: meta.len(),
+            mtime,
+            ctime,
+        })
+    }
+}
+
 pub struct Workspace {
     root: PathBuf,
     server_config: &'static ServerConfig,
@@ -85,14 +137,22 @@ impl Workspace {
             Ok(client) => {
                 let init_time = start_time.elapsed();
 
+                let ready_start = std::time::Instant::now();
                 if self.server_config.name == "clangd" {
                     client.wait_for_indexing(60).await;
                     self.ensure_workspace_indexed(&client).await;
                 }
 
+                // jdtls can return incomplete results until its project import
+                // finishes, which it signals with a ServiceReady language/status.
+                if self.server_config.name == "jdtls" {
+                    client.wait_for_service_ready(60).await;
+                }
+
+                let ready_time = ready_start.elapsed();
+
                 self.client = Some(client);
                 let total_time = total_start.elapsed();
-                let ready_time = std::time::Duration::ZERO;
 
                 info!(
                     "Server {} initialized and ready in {:?}",
@@ -241,23 +301,32 @@ impl Workspace {
 
     pub async fn ensure_document_open(&mut self, path: &Path) -> Result<(), String> {
         let uri = path_to_uri(path);
-
-        if let Some(doc) = self.open_documents.get(&uri) {
-            let current_content = read_file_content(path).map_err(|e| e.to_string())?;
-            if current_content != doc.content {
+        let stamp = FileStamp::trusted(path);
+
+        let content = match self.open_documents.get_mut(&uri) {
+            // Same file and change times as when it was opened, so the open copy is current
+            Some(doc) if stamp.is_some() && doc.stamp == stamp => return Ok(()),
+            Some(doc) => {
+                let content = read_file_content(path).map_err(|e| e.to_string())?;
+                if content == doc.content {
+                    // Touched but not changed; remember the new stamp so the
+                    // next call can skip the read again.
+                    doc.stamp = stamp;
+                    return Ok(());
+                }
                 self.close_document(path).await;
-            } else {
-                return Ok(());
+                content
             }
-        }
+            None => read_file_content(path).map_err(|e| e.to_string())?,
+        };
 
-        let content = read_file_content(path).map_err(|e| e.to_string())?;
         let language_id = get_language_id(path).to_string();
 
         let doc = OpenDocument {
             _uri: uri.clone(),
             _version: 1,
             content: content.clone(),
+            stamp,
             _language_id: language_id.clone(),
         };
 
@@ -330,7 +399,7 @@ type StartupLocks = Mutex<HashMap<StartupLockKey, Arc<Mutex<()>>>>;
 
 pub struct Session {
     workspaces: RwLock<HashMap<PathBuf, HashMap<String, Workspace>>>,
-    config: RwLock<Config>,
+    config: RwLock<Arc<Config>>,
     workspace_profiling: RwLock<Vec<leta_types::WorkspaceProfilingData>>,
     startup_locks: StartupLocks,
 }
@@ -339,7 +408,7 @@ impl Session {
     pub fn new(config: Config) -> Self {
         Self {
             workspaces: RwLock::new(HashMap::new()),
-            config: RwLock::new(config),
+            config: RwLock::new(Arc::new(config)),
             workspace_profiling: RwLock::new(Vec::new()),
             startup_locks: Mutex::new(HashMap::new()),
         }
@@ -356,8 +425,8 @@ impl Session {
     }
 
     #[trace]
-    pub async fn config(&self) -> Config {
-        self.config.read().await.clone()
+    pub async fn config(&self) -> Arc<Config> {
+        Arc::clone(&*self.config.read().await)
     }
 
     #[trace]
@@ -394,6 +463,15 @@ impl Session {
             .await
     }
 
+    async fn startup_lock(&self, workspace_root: &Path, server_name: &str) -> Arc<Mutex<()>> {
+        let mut locks = self.startup_locks.lock().await;
+        let key = (workspace_root.to_path_buf(), server_name.to_string());
+        locks
+            .entry(key)
+            .or_insert_with(|| Arc::new(Mutex::new(())))
+            .clone()
+    }
+
     #[trace]
     async fn get_or_create_workspace_for_server(
         &self,
@@ -405,14 +483,7 @@ impl Session {
             .unwrap_or_else(|_| workspace_root.to_path_buf());
 
         // Get or create a per-workspace/server lock to prevent concurrent starts
-        let startup_lock = {
-            let mut locks = self.startup_locks.lock().await;
-            let key = (workspace_root.clone(), server_config.name.to_string());
-            locks
-                .entry(key)
-                .or_insert_with(|| Arc::new(Mutex::new(())))
-                .clone()
-        };
+        let startup_lock = self.startup_lock(&workspace_root, server_config.name).await;
 
         // Hold the startup lock while we check and potentially start the server
         let _startup_guard = startup_lock.lock().await;
@@ -500,15 +571,52 @@ impl Session {
     #[trace]
     pub async fn restart_workspace(&self, root: &Path) -> Result<Vec<String>, String> {
         let root = root.canonicalize().unwrap_or_else(|_| root.to_path_buf());
-        let mut workspaces = self.workspaces.write().await;
+
+        let servers: Vec<(String, &'static ServerConfig)> = {
+            let workspaces = self.workspaces.read().await;
+            workspaces
+                .get(&root)
+                .map(|servers| {
+                    servers
+                        .iter()
+                        .map(|(name, workspace)| (name.clone(), workspace.server_config))
+                        .collect()
+                })
+                .unwrap_or_default()
+        };
 
         let mut restarted = Vec::new();
-        if let Some(servers) = workspaces.get_mut(&root) {
-            for (name, workspace) in servers.iter_mut() {
-                workspace.stop_server().await;
-                workspace.start_server().await?;
-                restarted.push(name.clone());
+        for (name, server_config) in servers {
+            // Stopping and starting can take a long time (jdtls waits for
+            // ServiceReady), so like get_or_create_workspace_for_server only
+            // the startup lock is held for it, not the session-wide lock.
+            let startup_lock = self.startup_lock(&root, server_config.name).await;
+            let _startup_guard = startup_lock.lock().await;
+
+            let old_client = {
+                let mut workspaces = self.workspaces.write().await;
+                workspaces
+                    .get_mut(&root)
+                    .and_then(|servers| servers.get_mut(&name))
+                    .and_then(|workspace| {
+                        workspace.open_documents.clear();
+                        workspace.client.take()
+                    })
+            };
+            if let Some(client) = old_client {
+                info!("Stopping {}", server_config.name);
+                let _ = client.stop().await;
             }
+
+            let mut new_workspace = Workspace::new(root.clone(), server_config);
+            new_workspace.start_server().await?;
+
+            let mut workspaces = self.workspaces.write().await;
+            workspaces
+                .entry(root.clone())
+                .or_insert_with(HashMap::new)
+                .insert(name.clone(), new_workspace);
+            restarted.push(name);
         }
         Ok(restarted)
     }
@@ -579,40 +687,67 @@ impl<'a> WorkspaceHandle<'a> {
     #[trace]
     pub async fn ensure_document_open(&self, path: &Path) -> Result<(), String> {
         let uri = path_to_uri(path);
+        let stamp = FileStamp::trusted(path);
 
         // First check if document needs updating (read lock only)
-        let (needs_open, needs_reopen, client) = {
+        let (is_open, client) = {
             let workspaces = self.session.workspaces.read().await;
             let workspace = workspaces
                 .get(&self.workspace_root)
                 .and_then(|servers| servers.get(&self.server_name))
                 .ok_or_else(|| "Workspace not found".to_string())?;
 
-            let client = workspace.client();
-
-            if let Some(doc) = workspace.open_documents.get(&uri) {
-                let current_content = read_file_content(path).map_err(|e| e.to_string())?;
-                if current_content != doc.content {
-                    (false, true, client) // needs reopen (close then open)
-                } else {
-                    (false, false, client) // already open with same content
-                }
-            } else {
-                (true, false, client) // needs open
+            match workspace.open_documents.get(&uri) {
+                // Same file and change times as when it was opened, so the open copy is current
+                Some(doc) if stamp.is_some() && doc.stamp == stamp => return Ok(()),
+                doc => (doc.is_some(), workspace.client()),
             }
         };
 
-        if !needs_open && !needs_reopen {
-            return Ok(());
-        }
+        // Read file content outside the lock
+        let content = read_file_content(path).map_err(|e| e.to_string())?;
+
+        if is_open {
+            // Compare under the read lock; only a stamp refresh or a reopen
+            // needs the write lock
+            let open_doc = {
+                let workspaces = self.session.workspaces.read().await;
+                let workspace = workspaces
+                    .get(&self.workspace_root)
+                    .and_then(|servers| servers.get(&self.server_name))
+                    .ok_or_else(|| "Workspace not found".to_string())?;
+
+                workspace
+                    .open_documents
+                    .get(&uri)
+                    .map(|doc| (doc.content == content, doc.stamp))
+            };
 
-        // Close first if needed
-        if needs_reopen {
-            self.close_document(path).await;
+            match open_doc {
+                Some((true, doc_stamp)) => {
+                    if stamp.is_some() && doc_stamp != stamp {
+                        // Touched but not changed; remember the new stamp so
+                        // the next call can skip the read again.
+                        let mut workspaces = self.session.workspaces.write().await;
+                        if let Some(doc) = workspaces
+                            .get_mut(&self.workspace_root)
+                            .and_then(|servers| servers.get_mut(&self.server_name))
+                            .and_then(|workspace| workspace.open_documents.get_mut(&uri))
+                        {
+                            if doc.content == content {
+                                doc.stamp = stamp;
+                            }
+                        }
+                    }
+                    return Ok(()); // already open with same content
+                }
+                // Close first so the reopen below sends the new content
+                Some((false, _)) => self.close_document(path).await,
+                // Closed since the first check; open it fresh
+                None => {}
+            }
         }
 
-        // Read file content
-        let content = read_file_content(path).map_err(|e| e.to_string())?;
         let language_id = get_language_id(path).to_string();
 
         // Insert document record (write lock, but no LSP call)
@@ -627,6 +762,7 @@ impl<'a> WorkspaceHandle<'a> {
                 _uri: uri.clone(),
                 _version: 1,
                 content: content.clone(),
+                stamp,
                 _language_id: language_id.clone(),
             };
             workspace.open_documents.insert(uri.clone(), doc);
@@ -711,3 +847,84 @@ impl<'a> WorkspaceHandle<'a> {
             .await;
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+    use std::fs::{File, FileTimes};
+
+    const LATER: Duration = Duration::from_secs(60);
+
+    fn set_mtime(path: &Path, mtime: SystemTime) {
+        File::options()
+            .write(true)
+            .open(path)
+            .unwrap()
+            .set_times(FileTimes::new().set_modified(mtime))
+            .unwrap();
+    }
+
+    #[test]
+    fn test_file_stamp_not_trusted_when_just_written() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("main.go");
+        std::fs::write(&path, "package main\n").unwrap();
+
+        assert!(FileStamp::trusted_at(&path, SystemTime::now()).is_none());
+    }
+
+    #[test]
+    fn test_file_stamp_trusted_when_old() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("main.go");
+        std::fs::write(&path, "package main\n").unwrap();
+        let now = SystemTime::now() + LATER;
+
+        let stamp = FileStamp::trusted_at(&path, now);
+        assert!(stamp.is_some());
+        assert!(stamp == FileStamp::trusted_at(&path, now));
+    }
+
+    #[test]
+    fn test_file_stamp_catches_mtime_preserving_replace() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("main.go");
+        let backup = dir.path().join("main.go.bak");
+        let mtime = SystemTime::now() - LATER;
+        std::fs::write(&path, "func a() {}\n").unwrap();
+        std::fs::write(&backup, "func b() {}\n").unwrap();
+        set_mtime(&path, mtime);
+        set_mtime(&backup, mtime);
+        let now = SystemTime::now() + LATER;
+        let before = FileStamp::trusted_at(&path, now).unwrap();
+
+        // Same length and mtime, like `mv main.go.bak main.go` after `cp -p`
+        std::fs::rename(&backup, &path).unwrap();
+
+        let after = FileStamp::trusted_at(&path, now).unwrap();
+        assert_eq!(before.len, after.len);
+        assert_eq!(before.mtime, after.mtime);
+        assert!(before != after);
+    }
+
+    #[test]
+    fn test_file_stamp_catches_in_place_rewrite_with_restored_mtime() {
+        let dir = tempfile::tempdir().unwrap();
+        let path = dir.path().join("main.go");
+        let mtime = SystemTime::now() - LATER;
+        std::fs::write(&path, "func a() {}\n").unwrap();
+        set_mtime(&path, mtime);
+        let now = SystemTime::now() + LATER;
+        let before = FileStamp::trusted_at(&path, now).unwrap();
+
+        // Let the coarse kernel clock tick so the rewrite gets a new ctime
+        std::thread::sleep(Duration::from_millis(50));
+        std::fs::write(&path, "func b() {}\n").unwrap();
+        set_mtime(&path, mtime); // like `touch -r`
+
+        let after = FileStamp::trusted_at(&path, now).unwrap();
+        assert_eq!(before.len, after.len);
+        assert_eq!(before.mtime, after.mtime);
+        assert!(before != after);
+    }
+}
@@ -16,7 +16,7 @@ use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use tokio::io::{AsyncBufReadExt, AsyncWriteExt, BufReader};
 use tokio::process::{Child, ChildStderr, ChildStdin, ChildStdout};
-use tokio::sync::{oneshot, Mutex, RwLock};
+use tokio::sync::{oneshot, watch, Mutex, RwLock};
 use tracing::{debug, error, info, warn};
 
 use crate::capabilities::get_client_capabilities;
@@ -118,8 +118,8 @@ pub struct LspClient {
     // (e.g. typeHierarchyProvider was added in LSP 3.17 but lsp-types 0.97.0 doesn't have it)
     raw_capabilities: RwLock<Value>,
     initialized: RwLock<bool>,
-    service_ready: RwLock<bool>,
-    indexing_done: RwLock<bool>,
+    service_ready: watch::Sender<bool>,
+    indexing_done: watch::Sender<bool>,
     active_progress_tokens: Mutex<HashSet<String>>,
 }
 
@@ -161,10 +161,10 @@ impl LspClient {
             raw_capabilities: RwLock::new(Value::Null),
             initialized: RwLock::new(false),
             // jdtls uses language/status ServiceReady notification instead of progress
-            service_ready: RwLock::new(server_name != "jdtls"),
+            service_ready: watch::Sender::new(server_name != "jdtls"),
             // rust-analyzer uses experimental/serverStatus to signal quiescence
             // other servers may not send progress notifications, so assume ready
-            indexing_done: RwLock::new(server_name != "rust-analyzer"),
+            indexing_done: watch::Sender::new(server_name != "rust-analyzer"),
             active_progress_tokens: Mutex::new(HashSet::new()),
         });
 
@@ -507,7 +507,7 @@ impl LspClient {
                 {
                     if p.status_type == "ServiceReady" {
                         info!("Server {} is now ServiceReady", self.server_name);
-                        *self.service_ready.write().await = true;
+                        self.service_ready.send_replace(true);
                     }
                 }
             }
@@ -524,17 +524,17 @@ impl LspClient {
                     );
 
                     if quiescent && health != "error" {
-                        *self.indexing_done.write().await = true;
+                        self.indexing_done.send_replace(true);
                         info!("Server {} is quiescent (ready)", self.server_name);
                     } else {
-                        let was_done = *self.indexing_done.read().await;
+                        let was_done = *self.indexing_done.borrow();
                         if was_done {
                             info!(
                                 "Server {} is no longer quiescent (was ready, now busy)",
                                 self.server_name
                             );
                         }
-                        *self.indexing_done.write().await = false;
+                        self.indexing_done.send_replace(false);
                     }
                 }
             }
@@ -568,12 +568,12 @@ impl LspClient {
         match progress {
             WorkDoneProgress::Begin(_) => {
                 tokens.insert(token);
-                *self.indexing_done.write().await = false;
+                self.indexing_done.send_replace(false);
             }
             WorkDoneProgress::End(_) => {
                 tokens.remove(&token);
                 if tokens.is_empty() {
-                    *self.indexing_done.write().await = true;
+                    self.indexing_done.send_replace(true);
                 }
             }
             WorkDoneProgress::Report(_) => {}
@@ -590,46 +590,43 @@ impl LspClient {
             self.server_name, timeout_secs
         );
 
-        loop {
-            let is_done = *self.indexing_done.read().await;
-            if is_done {
-                debug!(
-                    "wait_for_indexing({}): done after {:?}",
-                    self.server_name,
-                    start.elapsed()
-                );
-                return true;
-            }
-            if start.elapsed() >= timeout {
-                warn!(
-                    "Timeout waiting for {} to finish indexing after {:?}",
-                    self.server_name,
-                    start.elapsed()
-                );
-                return false;
-            }
-            tokio::time::sleep(Duration::from_millis(100)).await;
+        let mut done_rx = self.indexing_done.subscribe();
+        let is_done = matches!(
+            tokio::time::timeout(timeout, done_rx.wait_for(|done| *done)).await,
+            Ok(Ok(_))
+        );
+        if is_done {
+            debug!(
+                "wait_for_indexing({}): done after {:?}",
+                self.server_name,
+                start.elapsed()
+            );
+        } else {
+            warn!(
+                "Timeout waiting for {} to finish indexing after {:?}",
+                self.server_name,
+                start.elapsed()
+            );
         }
+        is_done
     }
 
     #[trace]
     pub async fn wait_for_service_ready(&self, timeout_secs: u64) -> bool {
-        let start = std::time::Instant::now();
         let timeout = Duration::from_secs(timeout_secs);
 
-        loop {
-            if *self.service_ready.read().await {
-                return true;
-            }
-            if start.elapsed() >= timeout {
-                warn!(
-                    "Timeout waiting for {} to become ServiceReady",
-                    self.server_name
-                );
-                return false;
-            }
-            tokio::time::sleep(Duration::from_millis(100)).await;
+        let mut ready_rx = self.service_ready.subscribe();
+        let is_ready = matches!(
+            tokio::time::timeout(timeout, ready_rx.wait_for(|ready| *ready)).await,
+            Ok(Ok(_))
+        );
+        if !is_ready {
+            warn!(
+                "Timeout waiting for {} to become ServiceReady",
+                self.server_name
+            );
         }
+        is_ready
     }
 
     #[trace]
@@ -1,6 +1,7 @@
 use std::collections::HashMap;
 use std::path::Path;
 use std::process::Command;
+use std::sync::{LazyLock, Mutex};
 
 use fastrace::trace;
 use leta_config::Config;
@@ -36,9 +37,24 @@ pub fn get_server_env() -> HashMap<String, String> {
     env
 }
 
+// Server lookup happens once per file during workspace scans, so remember
+// the PATH probe per binary. Users restart the daemon after installing a
+// server (the install hint says so), which starts with a fresh cache.
+static INSTALLED_SERVERS: LazyLock<Mutex<HashMap<&'static str, bool>>> =
+    LazyLock::new(|| Mutex::new(HashMap::new()));
+
 fn is_server_installed(server: &ServerConfig) -> bool {
-    let path = get_extended_path();
     let cmd = server.command[0];
+    if let Some(&installed) = INSTALLED_SERVERS.lock().unwrap().get(cmd) {
+        return installed;
+    }
+    let installed = find_server_binary(cmd);
+    INSTALLED_SERVERS.lock().unwrap().insert(cmd, installed);
+    installed
+}
+
+fn find_server_binary(cmd: &str) -> bool {
+    let path = get_extended_path();
 
     for dir in path.split(':') {
         let full_path = Path::new(dir).join(cmd);
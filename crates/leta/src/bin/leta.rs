@@ -244,7 +244,9 @@ enum WorkspaceCommands {
     Info,
 }
 
-#[tokio::main]
+// Each CLI invocation makes a handful of sequential socket round-trips, so a
+// single-threaded runtime avoids spinning up a worker pool on every command.
+#[tokio::main(flavor = "current_thread")]
 async fn main() -> Result<()> {
     let total_start = profile_start("total");
     let cli = Cli::parse();
@@ -556,7 +558,7 @@ async fn send_request_with_profile(
     .await
     .map_err(|_| anyhow!("Timeout waiting for daemon response (method: {})", method))??;
 
-    let response: Value = serde_json::from_slice(&response_data)?;
+    let mut response: Value = serde_json::from_slice(&response_data)?;
 
     if let Some(error) = response.get("error").and_then(|e| e.as_str()) {
         if error.contains("Internal error") || error.to_lowercase().contains("internal error") {
@@ -578,10 +580,13 @@ async fn send_request_with_profile(
         return Err(anyhow!("{}", error));
     }
 
-    let result = response.get("result").cloned().unwrap_or(Value::Null);
+    let result = response
+        .get_mut("result")
+        .map(Value::take)
+        .unwrap_or(Value::Null);
     let profiling: Option<ProfilingData> = response
-        .get("profiling")
-        .and_then(|p| serde_json::from_value(p.clone()).ok());
+        .get_mut("profiling")
+        .and_then(|p| serde_json::from_value(p.take()).ok());
 
     Ok(DaemonResponse { result, profiling })
 }
@@ -718,11 +723,11 @@ async fn handle_daemon_command(command: DaemonCommands) -> Result<()> {
         DaemonCommands::Restart => {
             if is_daemon_running() {
                 send_request("shutdown", json!({})).await?;
-                for _ in 0..50 {
+                for _ in 0..250 {
                     if !get_socket_path().exists() {
                         break;
                     }
-                    tokio::time::sleep(Duration::from_millis(100)).await;
+                    tokio::time::sleep(Duration::from_millis(20)).await;
                 }
             }
             ensure_daemon_running().await?;
@@ -879,91 +884,61 @@ async fn handle_grep(
 
     let workspace_root = get_workspace_root(config)?;
 
+    let params = json!({
+        "workspace_root": workspace_root.to_string_lossy(),
+        "pattern": pattern,
+        "kinds": kinds,
+        "case_sensitive": case_sensitive,
+        "include_docs": docs,
+        "path_pattern": path,
+        "exclude_patterns": exclude,
+        "limit": head,
+    });
+    let command_base = || {
+        let mut cmd_parts = vec![format!("leta grep \"{}\"", pattern)];
+        if let Some(p) = &path {
+            cmd_parts.push(format!("\"{}\"", p));
+        }
+        if let Some(k) = &kind {
+            cmd_parts.push(format!("-k {}", k));
+        }
+        for ex in &exclude {
+            cmd_parts.push(format!("-x \"{}\"", ex));
+        }
+        if docs {
+            cmd_parts.push("-d".to_string());
+        }
+        if case_sensitive {
+            cmd_parts.push("-C".to_string());
+        }
+        cmd_parts.join(" ")
+    };
+
     if json_output || profile {
         // Use non-streaming path for JSON output or profiling (profiling needs full timing data)
-        let response = send_request_with_profile(
-            "grep",
-            json!({
-                "workspace_root": workspace_root.to_string_lossy(),
-                "pattern": pattern,
-                "kinds": kinds,
-                "case_sensitive": case_sensitive,
-                "include_docs": docs,
-                "path_pattern": path,
-                "exclude_patterns": exclude,
-                "limit": head,
-            }),
-            profile,
-        )
-        .await?;
+        let response = send_request_with_profile("grep", params, profile).await?;
 
         let grep_result: GrepResult = serde_json::from_value(response.result)?;
         if json_output {
             println!("{}", serde_json::to_string_pretty(&grep_result)?);
         } else {
-            let mut cmd_parts = vec![format!("leta grep \"{}\"", pattern)];
-            if let Some(p) = &path {
-                cmd_parts.push(format!("\"{}\"", p));
-            }
-            if let Some(k) = &kind {
-                cmd_parts.push(format!("-k {}", k));
-            }
-            for ex in &exclude {
-                cmd_parts.push(format!("-x \"{}\"", ex));
-            }
-            if docs {
-                cmd_parts.push("-d".to_string());
-            }
-            if case_sensitive {
-                cmd_parts.push("-C".to_string());
-            }
-            let command_base = cmd_parts.join(" ");
+            let command_base = command_base();
             println!("{}", format_grep_result(&grep_result, head, &command_base));
         }
         display_profiling(response.profiling);
     } else {
         // Use streaming path - print symbols immediately as they arrive
         let mut count = 0u32;
-        let done = send_streaming_request(
-            "grep",
-            json!({
-                "workspace_root": workspace_root.to_string_lossy(),
-                "pattern": pattern,
-                "kinds": kinds,
-                "case_sensitive": case_sensitive,
-                "include_docs": docs,
-                "path_pattern": path,
-                "exclude_patterns": exclude,
-                "limit": head,
-            }),
-            false,
-            |msg| {
-                if let StreamMessage::Symbol(sym) = msg {
-                    println!("{}", format_symbol_line(&sym));
-                    count += 1;
-                }
-            },
-        )
+        let done = send_streaming_request("grep", params, false, |msg| {
+            if let StreamMessage::Symbol(sym) = msg {
+                println!("{}", format_symbol_line(&sym));
+                count += 1;
+            }
+        })
         .await?;
 
         if done.truncated {
-            let mut cmd_parts = vec![format!("leta grep \"{}\"", pattern)];
-            if let Some(p) = &path {
-                cmd_parts.push(format!("\"{}\"", p));
-            }
-            if let Some(k) = &kind {
-                cmd_parts.push(format!("-k {}", k));
-            }
-            for ex in &exclude {
-                cmd_parts.push(format!("-x \"{}\"", ex));
-            }
-            if docs {
-                cmd_parts.push("-d".to_string());
-            }
-            if case_sensitive {
-                cmd_parts.push("-C".to_string());
-            }
-            let command_base = cmd_parts.join(" ");
+            let command_base = command_base();
             println!(
                 "\n[showing first {} results, use `{} --head {}` to show more, or `{} -N0` to show all]",
                 count,
@@ -1012,41 +987,41 @@ async fn handle_files(
         (get_workspace_root(config)?, None)
     };
 
+    let params = json!({
+        "workspace_root": workspace_root.to_string_lossy(),
+        "subpath": subpath,
+        "exclude_patterns": exclude,
+        "include_patterns": include,
+        "filter_pattern": filter,
+        "head": head,
+    });
+    let command_base = || {
+        let mut cmd_parts = vec!["leta files".to_string()];
+        if let Some(p) = &path {
+            cmd_parts.push(format!("\"{}\"", p));
+        }
+        for ex in &exclude {
+            cmd_parts.push(format!("-x \"{}\"", ex));
+        }
+        for inc in &include {
+            cmd_parts.push(format!("-i \"{}\"", inc));
+        }
+        if let Some(f) = &filter {
+            cmd_parts.push(format!("-f \"{}\"", f));
+        }
+        cmd_parts.join(" ")
+    };
+
     if json_output || profile {
         // Use non-streaming path for JSON output or profiling
-        let response = send_request_with_profile(
-            "files",
-            json!({
-                "workspace_root": workspace_root.to_string_lossy(),
-                "subpath": subpath,
-                "exclude_patterns": exclude,
-                "include_patterns": include,
-                "filter_pattern": filter,
-                "head": head,
-            }),
-            profile,
-        )
-        .await?;
+        let response = send_request_with_profile("files", params, profile).await?;
 
         let files_result: FilesResult = serde_json::from_value(response.result)?;
 
         if json_output {
             println!("{}", serde_json::to_string_pretty(&files_result)?);
         } else {
-            let mut cmd_parts = vec!["leta files".to_string()];
-            if let Some(p) = &path {
-                cmd_parts.push(format!("\"{}\"", p));
-            }
-            for ex in &exclude {
-                cmd_parts.push(format!("-x \"{}\"", ex));
-            }
-            for inc in &include {
-                cmd_parts.push(format!("-i \"{}\"", inc));
-            }
-            if let Some(f) = &filter {
-                cmd_parts.push(format!("-f \"{}\"", f));
-            }
-            let command_base = cmd_parts.join(" ");
+            let command_base = command_base();
             println!(
                 "{}",
                 format_files_result(&files_result, head, &command_base)
@@ -1058,41 +1033,16 @@ async fn handle_files(
         // Use streaming path - print files immediately as they arrive
         let mut count = 0u32;
         let mut printer = FileTreePrinter::new();
-        let done = send_streaming_request(
-            "files",
-            json!({
-                "workspace_root": workspace_root.to_string_lossy(),
-                "subpath": subpath,
-                "exclude_patterns": exclude,
-                "include_patterns": include,
-                "filter_pattern": filter,
-                "head": head,
-            }),
-            false,
-            |msg| {
-                if let StreamMessage::File(file) = msg {
-                    println!("{}", printer.format_file(&file));
-                    count += 1;
-                }
-            },
-        )
+        let done = send_streaming_request("files", params, false, |msg| {
+            if let StreamMessage::File(file) = msg {
+                println!("{}", printer.format_file(&file));
+                count += 1;
+            }
+        })
         .await?;
 
         if done.truncated {
-            let mut cmd_parts = vec!["leta files".to_string()];
-            if let Some(p) = &path {
-                cmd_parts.push(format!("\"{}\"", p));
-            }
-            for ex in &exclude {
-                cmd_parts.push(format!("-x \"{}\"", ex));
-            }
-            for inc in &include {
-                cmd_parts.push(format!("-i \"{}\"", inc));
-            }
-            if let Some(f) = &filter {
-                cmd_parts.push(format!("-f \"{}\"", f));
-            }
-            let command_base = cmd_parts.join(" ");
+            let command_base = command_base();
             println!(
                 "\n[showing first {} results, use `{} --head {}` to show more, or `{} -N0` to show all]",
                 count,
@@ -1399,12 +1349,13 @@ async fn handle_calls(
     });
 
     if let (Some(from_sym), Some(to_sym)) = (&from, &to) {
-        let from_resolved = resolve_symbol(from_sym, &workspace_root, false)
-            .await
-            .map_err(|e| e.into_anyhow())?;
-        let to_resolved = resolve_symbol(to_sym, &workspace_root, false)
-            .await
-            .map_err(|e| e.into_anyhow())?;
+        // The two lookups are independent daemon requests, so run them together.
+        let (from_resolved, to_resolved) = tokio::join!(
+            resolve_symbol(from_sym, &workspace_root, false),
+            resolve_symbol(to_sym, &workspace_root, false),
+        );
+        let from_resolved = from_resolved.map_err(|e| e.into_anyhow())?;
+        let to_resolved = to_resolved.map_err(|e| e.into_anyhow())?;
 
         params["from_path"] = json!(from_resolved.resolved.path);
         params["from_line"] = json!(from_resolved.resolved.line);